@@ -7,10 +7,12 @@ from agents.agents_config import DIALOGUE_AGENT_PROMPT
 # Configure logging
 logfire.configure(send_to_logfire="if-token-present")
 
-def create_dialogue_agent(system_prompt: str) -> Agent:
+def create_dialogue_agent(instructions: str) -> Agent:
+    # Instructions (unlike a system prompt) are sent on every run, not only when the
+    # history is empty, so a later turn with updated word lists reaches the model
     return Agent(
         model=DIALOGUE_LLM_MODEL,
-        system_prompt=system_prompt,
+        instructions=instructions,
         temperature=0.3,
         output_type=str,
         instrument=True,
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Depends
+import asyncio
 from models.words_model import UserProgress
 from db.progress import get_user_progress
 from utils.firebase_auth import get_current_user_firebase
@@ -14,7 +15,7 @@ async def get_user_progress_endpoint(user_id: str, current_user: User = Depends(
         raise HTTPException(status_code=403, detail="Can only access your own progress")
     
     try:
-        progress = get_user_progress(user_id)
+        progress = await asyncio.to_thread(get_user_progress, user_id)
         return progress
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch progress: {str(e)}") 
\ No newline at end of file
@@ -2,14 +2,16 @@ from fastapi import APIRouter, WebSocket
 from services.google_stt_service import GoogleSTTService
 from starlette.websockets import WebSocketDisconnect
 import asyncio
+import logging
 
 router = APIRouter()
 stt_service = GoogleSTTService()
+logger = logging.getLogger(__name__)
 
 @router.websocket("/ws")
 async def voice_websocket(websocket: WebSocket):
     await websocket.accept()
-    print("🔌 WebSocket connected")
+    logger.info("🔌 WebSocket connected")
 
     queue = asyncio.Queue()
 
@@ -19,7 +21,7 @@ async def voice_websocket(websocket: WebSocket):
                 data = await websocket.receive_bytes()
                 await queue.put(data)
         except WebSocketDisconnect:
-            print("❌ WebSocket disconnected")
+            logger.info("❌ WebSocket disconnected")
             await queue.put(None)  # Sentinel to end STT stream
 
     async def audio_stream():
@@ -34,9 +36,9 @@ async def voice_websocket(websocket: WebSocket):
 
     try:
         transcript = await stt_service.stream_transcribe(audio_stream())
-        print(f"🗣️ Final transcript: {transcript}")
-    except Exception as e:
-        print("🚨 STT error:", e)
+        logger.info("🗣️ Final transcript: %s", transcript)
+    except Exception:
+        logger.exception("🚨 STT error")
     finally:
         receiver_task.cancel()
         await websocket.close()
\ No newline at end of file
@@ -1,36 +1,77 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, Request
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Body
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from typing import List, Optional
+import asyncio
+import hashlib
+import orjson
+import logging
 from datetime import datetime
+from config import WORDS_BATCH_MAX_SIZE
 from models.words_model import WordCreate, WordResponse, WordUpdate, DialogueMessage, DialogueResponse
 from utils.firebase_auth import get_current_user_firebase
 from models.user import User
-from db.words import (
-    get_user_words, create_word, update_word, 
-    delete_word, get_known_words
-)
-from services.dialogue_service import run_dialogue_turn
+from db.words import create_word, create_words, update_word, delete_word
+from services.dialogue_service import run_dialogue_turn, stream_dialogue_turn
 from services.words_service import suggest_new_words_for_user
+from services.cache_service import (
+    get_cached_user_words, peek_cached_user_words, invalidate_user_words, get_cache_stats
+)
+from services.user_session_service import get_session
 
 router = APIRouter(tags=["words"])
+logger = logging.getLogger(__name__)
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison (RFC 9110) of an ETag against an If-None-Match header"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Proxies such as nginx weaken tags (W/"...") when they gzip the body
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+def _conditional_json_response(request: Request, content, etag_source: Optional[bytes] = None) -> Response:
+    """
+    Render content as JSON with ETag/Cache-Control headers, or a bare 304
+    when the client already holds the same representation.
+    etag_source defaults to the rendered body.
+    """
+    response = ORJSONResponse(content)
+    digest = hashlib.blake2b(etag_source if etag_source is not None else response.body, digest_size=16)
+    # no-cache: browsers may keep the body but must revalidate, so writes show up immediately
+    headers = {"ETag": f'"{digest.hexdigest()}"', "Cache-Control": "private, no-cache"}
+
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return response
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    from datetime import datetime
     return {"status": "healthy", "timestamp": datetime.now()}
 
+@router.get("/metrics")
+async def cache_metrics(current_user: User = Depends(get_current_user_firebase)):
+    """In-process cache hit/miss counters"""
+    return get_cache_stats()
 
-
-@router.get("/words/{user_id}", response_model=List[WordResponse])
-async def get_user_words_endpoint(user_id: str, current_user: User = Depends(get_current_user_firebase)):
+@router.get("/words/{user_id}", response_model=List[WordResponse], response_class=ORJSONResponse)
+async def get_user_words_endpoint(user_id: str, request: Request, current_user: User = Depends(get_current_user_firebase)):
     """Get all words for a user"""
     # Verify the user is requesting their own data
     if current_user.user_id != user_id:
         raise HTTPException(status_code=403, detail="Can only access your own words")
     
     try:
-        words = get_user_words(user_id)
-        return words
+        words = peek_cached_user_words(user_id)
+        if words is None:
+            words = await asyncio.to_thread(get_cached_user_words, user_id)
+        return _conditional_json_response(request, [w.model_dump() for w in words])
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch words: {str(e)}")
 
@@ -42,16 +83,35 @@ async def create_word_endpoint(word: WordCreate, current_user: User = Depends(ge
         raise HTTPException(status_code=403, detail="Can only create words for yourself")
     
     try:
-        new_word = create_word(word.user_id, word)
+        new_word = await asyncio.to_thread(create_word, word.user_id, word)
+        invalidate_user_words(word.user_id)
         return new_word
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create word: {str(e)}")
 
+@router.post("/words/batch", response_model=List[WordResponse])
+async def create_words_batch(
+    # Bounded so one request can't turn into an unbounded insert
+    words: List[WordCreate] = Body(..., max_length=WORDS_BATCH_MAX_SIZE),
+    current_user: User = Depends(get_current_user_firebase),
+):
+    """Add several words for a user in one request"""
+    # Verify the user is creating words for themselves
+    if any(word.user_id != current_user.user_id for word in words):
+        raise HTTPException(status_code=403, detail="Can only create words for yourself")
+    
+    try:
+        new_words = await asyncio.to_thread(create_words, current_user.user_id, words)
+        invalidate_user_words(current_user.user_id)
+        return new_words
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to create words: {str(e)}")
+
 @router.put("/words/{word_id}", response_model=WordResponse)
 async def update_word_endpoint(word_id: str, updates: WordUpdate, current_user: User = Depends(get_current_user_firebase)):
     """Update a word"""
     try:
-        updated_word = update_word(word_id, updates)
+        updated_word = await asyncio.to_thread(update_word, word_id, updates)
         if not updated_word:
             raise HTTPException(status_code=404, detail="Word not found")
         
@@ -59,6 +119,7 @@ async def update_word_endpoint(word_id: str, updates: WordUpdate, current_user:
         if updated_word.user_id != current_user.user_id:
             raise HTTPException(status_code=403, detail="Can only update your own words")
         
+        invalidate_user_words(updated_word.user_id)
         return updated_word
     except HTTPException:
         raise
@@ -71,17 +132,12 @@ async def update_word_endpoint(word_id: str, updates: WordUpdate, current_user:
 async def delete_word_endpoint(word_id: str, current_user: User = Depends(get_current_user_firebase)):
     """Delete a word"""
     try:
-        # First get the word to check ownership
-        words = get_user_words(current_user.user_id)
-        word_to_delete = next((w for w in words if w.id == word_id), None)
-        
-        if not word_to_delete:
-            raise HTTPException(status_code=404, detail="Word not found")
-        
-        success = delete_word(word_id)
+        # Ownership is enforced in the delete predicate itself
+        success = await asyncio.to_thread(delete_word, word_id, current_user.user_id)
         if not success:
             raise HTTPException(status_code=404, detail="Word not found")
         
+        invalidate_user_words(current_user.user_id)
         return {"message": "Word deleted successfully"}
     except HTTPException:
         raise
@@ -96,15 +152,22 @@ async def chat_with_ai(message: DialogueMessage, current_user: User = Depends(ge
         raise HTTPException(status_code=403, detail="Can only send messages for yourself")
     
     try:
-        # Get AI response using existing dialogue service
-        ai_response = await run_dialogue_turn(
+        # Run the dialogue turn and the word suggestion concurrently
+        dialogue_task = asyncio.create_task(run_dialogue_turn(
             user_id=message.user_id,
             student_response=message.message
-        )
-        
+        ))
+        suggest_task = asyncio.create_task(suggest_new_words_for_user(message.user_id))
+        try:
+            ai_response = await dialogue_task
+        except BaseException:
+            # No reply to send, so don't wait on the suggestion either
+            suggest_task.cancel()
+            raise
+
         # Get suggested words for this user
         try:
-            word_suggestion = suggest_new_words_for_user(message.user_id)
+            word_suggestion = await suggest_task
             suggested_words = word_suggestion.new_words
         except Exception:
             # Fallback if word suggestion fails
@@ -117,8 +180,50 @@ async def chat_with_ai(message: DialogueMessage, current_user: User = Depends(ge
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process message: {str(e)}") 
 
-@router.get("/new-words/{user_id}", response_model=List[WordResponse])
-async def get_new_words_endpoint(user_id: str, current_user: User = Depends(get_current_user_firebase)):
+def _sse_event(data: dict, event: Optional[str] = None) -> str:
+    """Format a single Server-Sent Events frame"""
+    frame = f"event: {event}\n" if event else ""
+    return frame + f"data: {orjson.dumps(data).decode()}\n\n"
+
+@router.post("/dialogue/stream")
+async def stream_chat_with_ai(message: DialogueMessage, current_user: User = Depends(get_current_user_firebase)):
+    """Send message to AI tutor and stream the reply as Server-Sent Events"""
+    # Verify the user is sending messages for themselves
+    if current_user.user_id != message.user_id:
+        raise HTTPException(status_code=403, detail="Can only send messages for yourself")
+
+    # Suggest words while the dialogue reply streams
+    suggest_task = asyncio.create_task(suggest_new_words_for_user(message.user_id))
+
+    async def event_stream():
+        try:
+            try:
+                async for delta in stream_dialogue_turn(
+                    user_id=message.user_id,
+                    student_response=message.message
+                ):
+                    yield _sse_event({"response": delta})
+            except Exception as e:
+                yield _sse_event({"detail": f"Failed to process message: {str(e)}"}, event="error")
+                return
+
+            try:
+                word_suggestion = await suggest_task
+                suggested_words = word_suggestion.new_words
+            except Exception:
+                # Fallback if word suggestion fails
+                suggested_words = []
+
+            yield _sse_event({"suggested_words": suggested_words}, event="suggestions")
+        finally:
+            # Covers errors and client disconnects (GeneratorExit) before the suggestion was awaited
+            if not suggest_task.done():
+                suggest_task.cancel()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@router.get("/new-words/{user_id}", response_model=List[WordResponse], response_class=ORJSONResponse)
+async def get_new_words_endpoint(user_id: str, request: Request, current_user: User = Depends(get_current_user_firebase)):
     """Get all new words for a user using suggest_new_words_for_user"""
     if current_user.user_id != user_id:
         raise HTTPException(status_code=403, detail="Can only access your own new words")
@@ -128,27 +233,32 @@ async def get_new_words_endpoint(user_id: str, current_user: User = Depends(get_
         
         if word_suggestion and hasattr(word_suggestion, "new_words"):
             # Convert WordSuggestion to WordResponse objects
-            new_word_objs = []
-            for word in word_suggestion.new_words:
-                usage = word_suggestion.usages.get(word)
-                if usage:
-                    # Create WordResponse object from the suggestion data
-                    # Note: These are suggested words, not yet in known_words table
-                    word_response = WordResponse(
-                        id=f"new_{word}",  # Generate a temporary ID for new words
-                        user_id=user_id,
-                        word=word,
-                        translation=usage.translation,  # Use the word translation
-                        example=usage.fr,  # Use French sentence as example
-                        created_at=datetime.now()
-                    )
-                    new_word_objs.append(word_response)
-            return new_word_objs
+            # Note: These are suggested words, not yet in known_words table
+            # Fields come from an already validated WordSuggestion, so skip re-validation
+            now = datetime.now()
+            new_word_objs = [
+                WordResponse.model_construct(
+                    id=f"new_{word}",  # Generate a temporary ID for new words
+                    user_id=user_id,
+                    word=word,
+                    translation=usage.translation,  # Use the word translation
+                    example=usage.fr,  # Use French sentence as example
+                    created_at=now
+                )
+                for word, usage in word_suggestion.items
+            ]
+
+            # created_at changes per request, so tag on the known words + suggestions instead
+            etag_source = orjson.dumps([
+                user_id,
+                sorted(get_session(user_id).known_words),
+                [[word, usage.model_dump()] for word, usage in word_suggestion.items],
+            ])
+            return _conditional_json_response(
+                request, [w.model_dump() for w in new_word_objs], etag_source=etag_source
+            )
         else:
-            return []
+            return _conditional_json_response(request, [])
     except Exception as e:
-        import traceback
-        print(f"Error in get_new_words_endpoint: {str(e)}")
-        print("Full stack trace:")
-        traceback.print_exc()
+        logger.exception("Error in get_new_words_endpoint")
         raise HTTPException(status_code=500, detail=f"Failed to fetch new words: {str(e)}") 
\ No newline at end of file
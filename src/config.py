@@ -17,6 +17,14 @@ WORDS_LLM_MODEL = os.getenv("WORDS_LLM_MODEL")
 DIALOGUE_LLM_MODEL = os.getenv("DIALOGUE_LLM_MODEL")
 FEEDBACK_LLM_MODEL = os.getenv("FEEDBACK_LLM_MODEL")
 
+# Max number of LLM calls in flight per process
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+
+# Max number of words accepted by one POST /words/batch
+WORDS_BATCH_MAX_SIZE = int(os.getenv("WORDS_BATCH_MAX_SIZE", "100"))
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
 LOGFIRE_TOKEN = os.getenv("OPENAI_API_KEY")
 GOOGLE_CREDS_PATH = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "firebase-service-account.json")
 
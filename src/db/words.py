@@ -1,5 +1,5 @@
 from supabase import Client
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from models.words_model import WordResponse, WordCreate, WordUpdate
 from db.supabase import supabase
 import uuid
@@ -27,6 +27,12 @@ def get_user_words(user_id: str) -> List[WordResponse]:
     
     return words
 
+def get_words_bundle(user_id: str) -> Tuple[List[str], List[WordResponse]]:
+    """Get known words and full word details for a user in a single query"""
+    words = get_user_words(user_id)
+    known_words = [w.word for w in words]
+    return known_words, words
+
 
 
 def create_word(user_id: str, word_data: WordCreate) -> WordResponse:
@@ -50,6 +56,35 @@ def create_word(user_id: str, word_data: WordCreate) -> WordResponse:
         created_at=datetime.fromisoformat(row["created_at"].replace("Z", "+00:00"))
     )
 
+def create_words(user_id: str, words_data: List[WordCreate]) -> List[WordResponse]:
+    """Create several words in a single multi-row insert"""
+    if not words_data:
+        return []
+
+    db_data = [
+        {
+            "user_id": user_id,
+            "word": word_data.word,
+            "translation": word_data.translation,
+            "example": word_data.example
+        }
+        for word_data in words_data
+    ]
+
+    response = supabase.table("words").insert(db_data).execute()
+
+    return [
+        WordResponse(
+            id=row["id"],
+            user_id=row["user_id"],
+            word=row["word"],
+            translation=row["translation"],
+            example=row.get("example"),
+            created_at=datetime.fromisoformat(row["created_at"].replace("Z", "+00:00"))
+        )
+        for row in response.data
+    ]
+
 def update_word(word_id: str, updates: WordUpdate) -> Optional[WordResponse]:
     """Update a word"""
     update_data = {}
@@ -84,7 +119,10 @@ def update_word(word_id: str, updates: WordUpdate) -> Optional[WordResponse]:
 
 
 
-def delete_word(word_id: str) -> bool:
-    """Delete a word by ID"""
-    response = supabase.table("words").delete().eq("id", word_id).execute()
+def delete_word(word_id: str, user_id: Optional[str] = None) -> bool:
+    """Delete a word by ID, optionally restricted to the owning user"""
+    query = supabase.table("words").delete().eq("id", word_id)
+    if user_id is not None:
+        query = query.eq("user_id", user_id)
+    response = query.execute()
     return len(response.data) > 0
\ No newline at end of file
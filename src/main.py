@@ -1,12 +1,22 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from config import LOG_LEVEL
+from utils.logging_config import setup_logging
+
 from api.auth import router as auth_router
 from api.voice import router as voice_router
 from api.words import router as words_router
 from api.progress import router as progress_router
 
-app = FastAPI(title="FreeLingo API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener = setup_logging(LOG_LEVEL)
+    yield
+    log_listener.stop()
+
+app = FastAPI(title="FreeLingo API", version="1.0.0", lifespan=lifespan)
 
 
 
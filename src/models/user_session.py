@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pydantic_ai.messages import ModelMessage
@@ -10,6 +10,7 @@ class UserSession:
     known_words: List[str] = field(default_factory=list)
     new_words: List[str] = field(default_factory=list)
     dialogue_agent: Optional[Agent] = None
+    dialogue_agent_key: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None
     dialogue_history: List[ModelMessage] = field(default_factory=list)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
\ No newline at end of file
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Dict, Optional
+from pydantic import BaseModel, PrivateAttr, model_validator
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 class UsageExample(BaseModel):
@@ -10,6 +10,19 @@ class UsageExample(BaseModel):
 class WordSuggestion(BaseModel):
     new_words: List[str]
     usages: Dict[str, UsageExample]  # word -> usage object
+    _items: List[Tuple[str, UsageExample]] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode="after")
+    def pair_words_with_usages(self) -> "WordSuggestion":
+        # Drop suggested words the LLM gave no usage for, so consumers never reconcile the two
+        self._items = [(word, self.usages[word]) for word in self.new_words if word in self.usages]
+        self.new_words = [word for word, _ in self._items]
+        return self
+
+    @property
+    def items(self) -> List[Tuple[str, UsageExample]]:
+        """(word, usage) pairs for each suggested word, in suggestion order"""
+        return self._items
 
 # New models for React UI compatibility
 class WordCreate(BaseModel):
@@ -0,0 +1,127 @@
+# src/services/cache_service.py
+
+from typing import Dict, List, Optional, Tuple
+from cachetools import TTLCache
+import hashlib
+import threading
+import orjson
+
+from db.words import get_words_bundle
+from models.words_model import WordResponse, WordSuggestion
+from services.user_session_service import clear_known_words_in_session
+
+# In-process caches keyed by user_id (replace with Redis later)
+USER_WORDS_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+# Known words feed the LLM path and change only on mutation, so keep them longer
+KNOWN_WORDS_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+# LLM word suggestions keyed by a hash of the sorted known words
+SUGGESTION_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# DB lookups run in worker threads (asyncio.to_thread) and TTLCache isn't thread-safe
+_CACHE_LOCK = threading.Lock()
+
+# Bumped on every invalidation so a DB read that started before a mutation
+# can't write its stale result back into the caches afterwards
+_GENERATIONS: Dict[str, int] = {}
+
+CACHE_STATS: Dict[str, Dict[str, int]] = {
+    "user_words": {"hits": 0, "misses": 0},
+    "known_words": {"hits": 0, "misses": 0},
+    "suggestions": {"hits": 0, "misses": 0},
+}
+
+
+def words_generation(user_id: str) -> int:
+    with _CACHE_LOCK:
+        return _GENERATIONS.get(user_id, 0)
+
+
+def _load_words_bundle(user_id: str) -> Tuple[List[str], List[WordResponse]]:
+    # One query fills both caches so the dialogue path never pays two round-trips
+    generation = words_generation(user_id)
+    known_words, words = get_words_bundle(user_id)
+    with _CACHE_LOCK:
+        if _GENERATIONS.get(user_id, 0) == generation:
+            KNOWN_WORDS_CACHE[user_id] = known_words
+            USER_WORDS_CACHE[user_id] = words
+    return known_words, words
+
+
+def peek_cached_user_words(user_id: str) -> Optional[List[WordResponse]]:
+    """Return cached words without touching the DB, or None on a miss"""
+    with _CACHE_LOCK:
+        words = USER_WORDS_CACHE.get(user_id)
+        if words is None:
+            return None
+        CACHE_STATS["user_words"]["hits"] += 1
+        return list(words)
+
+
+def get_cached_user_words(user_id: str) -> List[WordResponse]:
+    words = peek_cached_user_words(user_id)
+    if words is not None:
+        return words
+
+    with _CACHE_LOCK:
+        CACHE_STATS["user_words"]["misses"] += 1
+    _, words = _load_words_bundle(user_id)
+    return list(words)
+
+
+def peek_cached_known_words(user_id: str) -> Optional[List[str]]:
+    """Return cached known words without touching the DB, or None on a miss"""
+    with _CACHE_LOCK:
+        known_words = KNOWN_WORDS_CACHE.get(user_id)
+        if known_words is None:
+            return None
+        CACHE_STATS["known_words"]["hits"] += 1
+        return list(known_words)
+
+
+def get_cached_known_words(user_id: str) -> List[str]:
+    known_words = peek_cached_known_words(user_id)
+    if known_words is not None:
+        return known_words
+
+    with _CACHE_LOCK:
+        CACHE_STATS["known_words"]["misses"] += 1
+    known_words, _ = _load_words_bundle(user_id)
+    return list(known_words)
+
+
+def invalidate_user_words(user_id: str) -> None:
+    """Drop cached word lists for a user after a mutation"""
+    with _CACHE_LOCK:
+        _GENERATIONS[user_id] = _GENERATIONS.get(user_id, 0) + 1
+        USER_WORDS_CACHE.pop(user_id, None)
+        KNOWN_WORDS_CACHE.pop(user_id, None)
+    # The dialogue path pins known words on the session; make it refetch so the next
+    # turn's agent (whose instructions are re-sent every run) sees the change
+    clear_known_words_in_session(user_id)
+
+
+def _suggestion_key(known_words: List[str]) -> str:
+    payload = orjson.dumps(sorted(known_words))
+    return f"suggest:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+def get_cached_suggestion(known_words: List[str]) -> Optional[WordSuggestion]:
+    suggestion = SUGGESTION_CACHE.get(_suggestion_key(known_words))
+    if suggestion is not None:
+        CACHE_STATS["suggestions"]["hits"] += 1
+    else:
+        CACHE_STATS["suggestions"]["misses"] += 1
+    return suggestion
+
+
+def cache_suggestion(known_words: List[str], suggestion: WordSuggestion) -> None:
+    SUGGESTION_CACHE[_suggestion_key(known_words)] = suggestion
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    with _CACHE_LOCK:
+        return {
+            "user_words": {**CACHE_STATS["user_words"], "size": len(USER_WORDS_CACHE)},
+            "known_words": {**CACHE_STATS["known_words"], "size": len(KNOWN_WORDS_CACHE)},
+            "suggestions": {**CACHE_STATS["suggestions"], "size": len(SUGGESTION_CACHE)},
+        }
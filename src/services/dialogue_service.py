@@ -1,31 +1,29 @@
+from typing import AsyncIterator, List, Tuple
+from pydantic_ai.messages import ModelMessage
+import asyncio
+
 from services.user_session_service import (
-    get_session,
     get_dialogue_history_from_session,
     update_dialogue_turn_in_session,
+    get_session,
 )
 from services.words_service import fetch_known_words
-from services.llm_service import get_dialogue_response
+from services.llm_service import get_dialogue_response, stream_dialogue_response
 from db.progress import increment_dialogue_sessions
 
 
-async def run_dialogue_turn(user_id: str, student_response: str) -> str:
+async def _prepare_dialogue_turn(user_id: str) -> Tuple[List[str], List[str], List[ModelMessage]]:
     """
-    Handles a single dialogue turn for the user.
-    Fetches known/new words and dialogue history from session,
-    calls LLM for the next AI message, and updates session.
-
-    Returns:
-        str: The AI's next French message.
+    Fetches known/new words and dialogue history from session
+    for the next dialogue turn.
     """
 
     session = get_session(user_id)
 
-    # Ensure known_words are in session
-    if not session.known_words:
-        session.known_words = fetch_known_words(user_id)
+    # Ensure known_words are in session (fetch_known_words stores them)
+    known_words = session.known_words or await fetch_known_words(user_id)
 
     # Use empty new_words if not present
-    known_words = session.known_words
     new_words = session.new_words or []
 
     # Fetch history
@@ -33,12 +31,27 @@ async def run_dialogue_turn(user_id: str, student_response: str) -> str:
 
     # Track dialogue session if this is the first turn
     if len(dialogue_history) == 0:
-        increment_dialogue_sessions(user_id)
+        await asyncio.to_thread(increment_dialogue_sessions, user_id)
 
     # Stop if dialogue is already complete
     # if len(conversation_history) >= 10:
     #    raise ValueError("Dialogue already complete (10 turns).")
 
+    return known_words, new_words, dialogue_history
+
+
+async def run_dialogue_turn(user_id: str, student_response: str) -> str:
+    """
+    Handles a single dialogue turn for the user.
+    Fetches known/new words and dialogue history from session,
+    calls LLM for the next AI message, and updates session.
+
+    Returns:
+        str: The AI's next French message.
+    """
+
+    known_words, new_words, dialogue_history = await _prepare_dialogue_turn(user_id)
+
     # Get next AI message
     ai_message, new_dialogue_history = await get_dialogue_response(
         user_id=user_id,
@@ -52,3 +65,23 @@ async def run_dialogue_turn(user_id: str, student_response: str) -> str:
     update_dialogue_turn_in_session(user_id, new_dialogue_history)
 
     return ai_message
+
+
+async def stream_dialogue_turn(user_id: str, student_response: str) -> AsyncIterator[str]:
+    """
+    Streaming variant of run_dialogue_turn.
+    Yields the AI's next French message in chunks as the LLM generates it,
+    and updates session once the message is complete.
+    """
+
+    known_words, new_words, dialogue_history = await _prepare_dialogue_turn(user_id)
+
+    async for delta in stream_dialogue_response(
+        user_id=user_id,
+        known_words=known_words,
+        new_words=new_words,
+        student_response=student_response,
+        dialogue_history=dialogue_history,
+        on_complete=lambda messages: update_dialogue_turn_in_session(user_id, messages),
+    ):
+        yield delta
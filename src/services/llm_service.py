@@ -1,11 +1,42 @@
-from typing import List, Tuple
-import json
+from typing import AsyncIterator, Callable, List, Tuple
+from functools import lru_cache
+import asyncio
+import orjson
+from pydantic_ai.exceptions import ModelHTTPError
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from config import LLM_MAX_CONCURRENCY
 from agents.words_agent import words_agent
 from agents.agents_config import DIALOGUE_AGENT_PROMPT
 from agents.dialogue_agent import create_dialogue_agent
 from models.words_model import WordSuggestion
 from pydantic_ai.messages import ModelMessage
 from services.user_session_service import get_session
+from services.cache_service import get_cached_suggestion, cache_suggestion
+
+# Bound the number of in-flight LLM calls so bursts queue instead of tripping rate limits.
+# Streamed runs hold a slot only while the model is generating (the client reads from a
+# queue), and are not retried on 429 since deltas may already have been sent.
+_LLM_SEM = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+# Marks the end of a streamed reply in the delta queue
+_STREAM_END = object()
+
+
+def _is_rate_limited(e: BaseException) -> bool:
+    return isinstance(e, ModelHTTPError) and e.status_code == 429
+
+
+@retry(
+    retry=retry_if_exception(_is_rate_limited),
+    wait=wait_exponential(multiplier=0.5, max=8),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+async def _run_agent(agent, **kwargs):
+    # Acquire per attempt so backoff sleeps don't hold a slot
+    async with _LLM_SEM:
+        return await agent.run(**kwargs)
+
 
 async def suggest_new_words(known_words: List[str]) -> WordSuggestion:
     """
@@ -18,19 +49,51 @@ async def suggest_new_words(known_words: List[str]) -> WordSuggestion:
         WordSuggestion: new words + example sentences
     """
 
+    # Identical known word sets get functionally equivalent suggestions
+    cached = get_cached_suggestion(known_words)
+    if cached is not None:
+        return cached
+
     try:
-        result = await words_agent.run(
+        result = await _run_agent(
+            words_agent,
             user_prompt = f"List of known words: {known_words}"
         )
-        parsed_output = json.loads(result.output)
-        print(parsed_output)
-        
-        return WordSuggestion(**parsed_output)
+        suggestion = WordSuggestion.model_validate_json(result.output)
+        cache_suggestion(known_words, suggestion)
+        return suggestion
     
     except Exception as e:
         raise RuntimeError(f"words_agent failed: {e}")
 
 
+@lru_cache(maxsize=1024)
+def _build_dialogue_agent(known_words: Tuple[str, ...], new_words: Tuple[str, ...]):
+    """
+    Builds a dialogue agent for a (known_words, new_words) signature.
+    Agents hold no per-user state, so users with identical word sets share one.
+    """
+    updated_dialogue_agent_prompt = DIALOGUE_AGENT_PROMPT.format(
+        known_words=orjson.dumps(list(known_words)).decode(),
+        new_words=orjson.dumps(list(new_words)).decode()
+    )
+    return create_dialogue_agent(updated_dialogue_agent_prompt)
+
+
+def get_session_dialogue_agent(user_id: str, known_words: List[str], new_words: List[str]):
+    session = get_session(user_id=user_id)
+    agent_key = (tuple(known_words), tuple(new_words))
+
+    # Only look up another agent when the user's word lists have changed
+    if session.dialogue_agent is None or session.dialogue_agent_key != agent_key:
+        session.dialogue_agent = _build_dialogue_agent(
+            tuple(sorted(known_words)), tuple(sorted(new_words))
+        )
+        session.dialogue_agent_key = agent_key
+
+    return session.dialogue_agent
+
+
 async def get_dialogue_response(
     user_id: str,
     known_words: List[str],
@@ -53,18 +116,10 @@ async def get_dialogue_response(
 
     try:
 
-        session = get_session(user_id=user_id)
-        dialogue_agent = session.dialogue_agent
-
-        if dialogue_agent is None:
-            updated_dialogue_agent_prompt = DIALOGUE_AGENT_PROMPT.format(
-                known_words=json.dumps(known_words, ensure_ascii=False),
-                new_words=json.dumps(new_words, ensure_ascii=False)
-            )
-            dialogue_agent = create_dialogue_agent(updated_dialogue_agent_prompt)
-            session.dialogue_agent = dialogue_agent
+        dialogue_agent = get_session_dialogue_agent(user_id, known_words, new_words)
       
-        result = await dialogue_agent.run(
+        result = await _run_agent(
+            dialogue_agent,
             user_prompt=student_response,
             message_history=dialogue_history
         )
@@ -73,3 +128,57 @@ async def get_dialogue_response(
 
     except Exception as e:
         raise RuntimeError(f"dialogue_agent failed: {e}")
+
+
+async def stream_dialogue_response(
+    user_id: str,
+    known_words: List[str],
+    new_words: List[str],
+    student_response: str,
+    dialogue_history: List[ModelMessage],
+    on_complete: Callable[[List[ModelMessage]], None],
+) -> AsyncIterator[str]:
+
+    """
+    Streams the dialogue_agent's next AI message in French as it is generated.
+
+    Args:
+        known_words (List[str]): Words the user already knows.
+        new_words (List[str]): 3 new words for this dialogue.
+        dialogue_history (List[ModelMessage]): Previous turns of the dialogue.
+        on_complete (Callable): Called with the full message history once the reply is complete.
+
+    Yields:
+        str: Text deltas of the AI message.
+    """
+
+    try:
+
+        dialogue_agent = get_session_dialogue_agent(user_id, known_words, new_words)
+        deltas: asyncio.Queue = asyncio.Queue()
+
+        async def generate() -> List[ModelMessage]:
+            # Drain the model at its own pace so a slow client can't hold the LLM slot
+            async with _LLM_SEM, dialogue_agent.run_stream(
+                user_prompt=student_response,
+                message_history=dialogue_history
+            ) as result:
+                async for delta in result.stream_text(delta=True):
+                    deltas.put_nowait(delta)
+                return result.all_messages()
+
+        generator_task = asyncio.create_task(generate())
+        generator_task.add_done_callback(lambda _: deltas.put_nowait(_STREAM_END))
+
+        try:
+            while (delta := await deltas.get()) is not _STREAM_END:
+                yield delta
+
+            # Re-raises if generation failed
+            on_complete(await generator_task)
+        finally:
+            # Stop generating if the client went away mid-stream
+            generator_task.cancel()
+
+    except Exception as e:
+        raise RuntimeError(f"dialogue_agent failed: {e}")
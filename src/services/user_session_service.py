@@ -22,6 +22,14 @@ def update_known_words_in_session(user_id: str, words: List[str]) -> None:
     session.updated_at = datetime.now(timezone.utc)
 
 
+def clear_known_words_in_session(user_id: str) -> None:
+    # Only touch existing sessions; don't create one just to clear it
+    session = SESSION_STORE.get(user_id)
+    if session:
+        session.known_words = []
+        session.updated_at = datetime.now(timezone.utc)
+
+
 def update_new_words_in_session(user_id: str, words: List[str]) -> None:
     session = get_session(user_id)
     session.new_words = words
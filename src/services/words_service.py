@@ -1,15 +1,26 @@
 # src/services/words_service.py
 
-from db.words import get_known_words, get_user_words
 from typing import List
+import asyncio
+import logging
 
 from models.words_model import WordSuggestion
-from services.llm_service import suggest_new_words
-from services.user_session_service import update_known_words_in_session, update_new_words_in_session
-
-def fetch_known_words(user_id: str) -> List[str]:
-    known_words = get_known_words(user_id)
-    update_known_words_in_session(user_id=user_id, words=known_words)
+from services.llm_service import suggest_new_words, get_session_dialogue_agent
+from services.cache_service import get_cached_known_words, peek_cached_known_words, words_generation
+from services.user_session_service import get_session, update_known_words_in_session, update_new_words_in_session
+
+logger = logging.getLogger(__name__)
+
+async def fetch_known_words(user_id: str) -> List[str]:
+    generation = words_generation(user_id)
+    known_words = peek_cached_known_words(user_id)
+    if known_words is None:
+        # Cache miss hits the DB; keep the blocking Supabase call off the event loop
+        known_words = await asyncio.to_thread(get_cached_known_words, user_id)
+
+    # Don't pin a list that a mutation invalidated while it was being read
+    if words_generation(user_id) == generation:
+        update_known_words_in_session(user_id=user_id, words=known_words)
     return known_words
 
 
@@ -17,7 +28,16 @@ def fetch_known_words(user_id: str) -> List[str]:
 
 
 async def suggest_new_words_for_user(user_id: str) -> WordSuggestion:
-    known_words = fetch_known_words(user_id)
+    known_words = await fetch_known_words(user_id)
     new_words = await suggest_new_words(known_words)
     update_new_words_in_session(user_id=user_id, words=new_words.new_words)
+
+    # Prewarm the agent for the next dialogue turn now that its word lists are known.
+    # This holds on later turns too: the agent's instructions are re-sent every run.
+    session = get_session(user_id)
+    try:
+        get_session_dialogue_agent(user_id, session.known_words, session.new_words)
+    except Exception as e:
+        # Not fatal; the dialogue turn builds the agent itself
+        logger.warning("Failed to prewarm dialogue agent for %s: %s", user_id, e)
     return new_words
\ No newline at end of file
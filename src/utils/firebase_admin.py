@@ -38,7 +38,8 @@ def verify_firebase_token(token: str) -> dict:
             "email": decoded_token.get("email", ""),
             "email_verified": decoded_token.get("email_verified", False),
             "name": decoded_token.get("name", ""),
-            "picture": decoded_token.get("picture", "")
+            "picture": decoded_token.get("picture", ""),
+            "exp": decoded_token.get("exp", 0)
         }
         
         return user_info
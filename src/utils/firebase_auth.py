@@ -3,15 +3,40 @@ from fastapi.security import HTTPBearer
 from models.user import User
 from utils.firebase_admin import verify_firebase_token
 from typing import Optional
+from cachetools import TTLCache
+import hashlib
+import time
 
 bearer_scheme = HTTPBearer()
 
+# Verified token -> (user_info, expires_at), keyed by a hash of the raw token
+_TOKEN_CACHE_MAX_TTL = 300
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=50_000, ttl=_TOKEN_CACHE_MAX_TTL)
+
+def verify_firebase_token_cached(token: str) -> dict:
+    """Verify a Firebase token, reusing the result until it expires (max 5 min)"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        user_info, expires_at = cached
+        if now < expires_at:
+            return user_info
+        _TOKEN_CACHE.pop(key, None)
+
+    user_info = verify_firebase_token(token)
+    expires_at = min(user_info.get("exp", 0), now + _TOKEN_CACHE_MAX_TTL)
+    if expires_at > now:
+        _TOKEN_CACHE[key] = (user_info, expires_at)
+    return user_info
+
 async def get_current_user_firebase(authorization=Depends(bearer_scheme)) -> User:
     """Get current user from Firebase JWT token using Admin SDK"""
     token = authorization.credentials
     try:
         # Use Firebase Admin SDK to verify token
-        user_info = verify_firebase_token(token)
+        user_info = verify_firebase_token_cached(token)
         
         return User(
             user_id=user_info["uid"],  # Firebase UID
@@ -26,7 +51,7 @@ def get_user_id_from_token(token: str) -> Optional[str]:
     """Extract user ID from Firebase token without verification (for testing)"""
     try:
         # Use Firebase Admin SDK for verification
-        user_info = verify_firebase_token(token)
+        user_info = verify_firebase_token_cached(token)
         return user_info["uid"]
     except Exception:
         return None
@@ -0,0 +1,25 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def setup_logging(level: str = "INFO") -> QueueListener:
+    """
+    Route all logging through a queue so stream I/O happens on the
+    listener's worker thread, not the event loop. The calling thread still
+    renders the message (args and traceback) in QueueHandler.prepare();
+    the listener only applies the line format and writes it.
+    Returns the started listener; call .stop() on shutdown to flush it.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
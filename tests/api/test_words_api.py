@@ -0,0 +1,235 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from api import words as words_api
+from models.user import User
+from models.words_model import WordSuggestion
+
+TEST_USER_ID = "user123"
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(words_api.router, prefix="/api")
+    app.dependency_overrides[words_api.get_current_user_firebase] = lambda: User(user_id=TEST_USER_ID, email="")
+    return TestClient(app)
+
+def _suggestion():
+    return WordSuggestion.model_validate({
+        "new_words": ["gare"],
+        "usages": {"gare": {"translation": "station", "fr": "La gare est ici.", "en": "The station is here."}},
+    })
+
+# ---- /words/batch ----
+def _batch(user_ids):
+    return [{"user_id": u, "word": f"mot{i}", "translation": f"word{i}"} for i, u in enumerate(user_ids)]
+
+def test_words_batch_rejects_whole_batch_for_other_user(client, monkeypatch):
+    inserted = []
+    monkeypatch.setattr(words_api, "create_words", lambda user_id, words: inserted.append(words))
+
+    response = client.post("/api/words/batch", json=_batch([TEST_USER_ID, "someone-else"]))
+
+    assert response.status_code == 403
+    assert inserted == []
+
+def test_words_batch_rejects_oversized_batch(client, monkeypatch):
+    inserted = []
+    monkeypatch.setattr(words_api, "create_words", lambda user_id, words: inserted.append(words))
+
+    response = client.post("/api/words/batch", json=_batch([TEST_USER_ID] * (words_api.WORDS_BATCH_MAX_SIZE + 1)))
+
+    assert response.status_code == 422
+    assert inserted == []
+
+# ---- /dialogue ----
+def test_dialogue_failure_cancels_suggestion(client, monkeypatch):
+    import asyncio
+
+    suggestion_cancelled = []
+
+    async def failing_run_dialogue_turn(user_id, student_response):
+        # Let the suggestion start before the dialogue fails
+        await asyncio.sleep(0)
+        raise RuntimeError("dialogue_agent failed: boom")
+
+    async def slow_suggest(user_id):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            suggestion_cancelled.append(True)
+            raise
+
+    monkeypatch.setattr(words_api, "run_dialogue_turn", failing_run_dialogue_turn)
+    monkeypatch.setattr(words_api, "suggest_new_words_for_user", slow_suggest)
+
+    response = client.post("/api/dialogue", json={"message": "Salut", "user_id": TEST_USER_ID})
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Failed to process message: dialogue_agent failed: boom"
+    assert suggestion_cancelled == [True]
+
+def test_dialogue_falls_back_to_no_suggestions(client, monkeypatch):
+    async def fake_run_dialogue_turn(user_id, student_response):
+        return "Bonjour !"
+
+    async def failing_suggest(user_id):
+        raise RuntimeError("words_agent failed")
+
+    monkeypatch.setattr(words_api, "run_dialogue_turn", fake_run_dialogue_turn)
+    monkeypatch.setattr(words_api, "suggest_new_words_for_user", failing_suggest)
+
+    response = client.post("/api/dialogue", json={"message": "Salut", "user_id": TEST_USER_ID})
+
+    assert response.json() == {"response": "Bonjour !", "suggested_words": []}
+
+# ---- /dialogue/stream ----
+def test_dialogue_stream_sends_deltas_then_suggestions(client, monkeypatch):
+    async def fake_stream_dialogue_turn(user_id, student_response):
+        for delta in ["Bon", "jour !"]:
+            yield delta
+
+    async def fake_suggest(user_id):
+        return _suggestion()
+
+    monkeypatch.setattr(words_api, "stream_dialogue_turn", fake_stream_dialogue_turn)
+    monkeypatch.setattr(words_api, "suggest_new_words_for_user", fake_suggest)
+
+    response = client.post("/api/dialogue/stream", json={"message": "Salut", "user_id": TEST_USER_ID})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'data: {"response":"Bon"}\n\n'
+        'data: {"response":"jour !"}\n\n'
+        'event: suggestions\ndata: {"suggested_words":["gare"]}\n\n'
+    )
+
+def test_dialogue_stream_sends_error_event(client, monkeypatch):
+    async def failing_stream_dialogue_turn(user_id, student_response):
+        yield "Bon"
+        raise RuntimeError("dialogue_agent failed: boom")
+
+    async def fake_suggest(user_id):
+        return _suggestion()
+
+    monkeypatch.setattr(words_api, "stream_dialogue_turn", failing_stream_dialogue_turn)
+    monkeypatch.setattr(words_api, "suggest_new_words_for_user", fake_suggest)
+
+    response = client.post("/api/dialogue/stream", json={"message": "Salut", "user_id": TEST_USER_ID})
+
+    assert response.text == (
+        'data: {"response":"Bon"}\n\n'
+        'event: error\ndata: {"detail":"Failed to process message: dialogue_agent failed: boom"}\n\n'
+    )
+
+def test_dialogue_stream_falls_back_to_no_suggestions(client, monkeypatch):
+    async def fake_stream_dialogue_turn(user_id, student_response):
+        yield "Bonjour"
+
+    async def failing_suggest(user_id):
+        raise RuntimeError("words_agent failed")
+
+    monkeypatch.setattr(words_api, "stream_dialogue_turn", fake_stream_dialogue_turn)
+    monkeypatch.setattr(words_api, "suggest_new_words_for_user", failing_suggest)
+
+    response = client.post("/api/dialogue/stream", json={"message": "Salut", "user_id": TEST_USER_ID})
+
+    assert response.text.endswith('event: suggestions\ndata: {"suggested_words":[]}\n\n')
+
+@pytest.mark.asyncio
+async def test_dialogue_stream_cancels_suggestion_on_disconnect(monkeypatch):
+    import asyncio
+
+    async def fake_stream_dialogue_turn(user_id, student_response):
+        for delta in ["Bon", "jour !"]:
+            yield delta
+
+    suggestion_started = asyncio.Event()
+    suggestion_cancelled = asyncio.Event()
+
+    async def slow_suggest(user_id):
+        suggestion_started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            suggestion_cancelled.set()
+            raise
+
+    monkeypatch.setattr(words_api, "stream_dialogue_turn", fake_stream_dialogue_turn)
+    monkeypatch.setattr(words_api, "suggest_new_words_for_user", slow_suggest)
+
+    response = await words_api.stream_chat_with_ai(
+        words_api.DialogueMessage(message="Salut", user_id=TEST_USER_ID),
+        current_user=User(user_id=TEST_USER_ID, email=""),
+    )
+    stream = response.body_iterator
+    assert await stream.__anext__() == 'data: {"response":"Bon"}\n\n'
+
+    # The client goes away after the first frame
+    await suggestion_started.wait()
+    await stream.aclose()
+
+    await asyncio.wait_for(suggestion_cancelled.wait(), timeout=1)
+
+# ---- ETag / conditional GET ----
+def _fake_user_words(monkeypatch, words):
+    from datetime import datetime
+    from models.words_model import WordResponse
+
+    rows = [
+        WordResponse(id=str(i), user_id=TEST_USER_ID, word=w, translation=w, created_at=datetime(2024, 1, 1))
+        for i, w in enumerate(words)
+    ]
+    monkeypatch.setattr(words_api, "peek_cached_user_words", lambda user_id: rows)
+
+def test_user_words_etag_and_304(client, monkeypatch):
+    _fake_user_words(monkeypatch, ["bonjour"])
+
+    first = client.get("/api/words/user123")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert first.json()[0]["word"] == "bonjour"
+
+    revalidated = client.get("/api/words/user123", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    # Weak tags (added by gzipping proxies) and tag lists still match
+    assert client.get("/api/words/user123", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert client.get("/api/words/user123", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+
+def test_user_words_etag_changes_with_content(client, monkeypatch):
+    _fake_user_words(monkeypatch, ["bonjour"])
+    etag = client.get("/api/words/user123").headers["etag"]
+
+    _fake_user_words(monkeypatch, ["bonjour", "chat"])
+    response = client.get("/api/words/user123", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()) == 2
+
+def test_new_words_etag_and_304(client, monkeypatch):
+    from services.user_session_service import SESSION_STORE
+    from models.user_session import UserSession
+
+    async def fake_suggest(user_id):
+        return _suggestion()
+
+    monkeypatch.setattr(words_api, "suggest_new_words_for_user", fake_suggest)
+    monkeypatch.setitem(SESSION_STORE, TEST_USER_ID, UserSession(user_id=TEST_USER_ID, known_words=["train"]))
+
+    first = client.get("/api/new-words/user123")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.json()[0]["id"] == "new_gare"
+
+    # created_at differs per request, but the tag only follows the words
+    assert client.get("/api/new-words/user123", headers={"If-None-Match": etag}).status_code == 304
+
+    # Learning a word changes the tag
+    SESSION_STORE[TEST_USER_ID].known_words = ["train", "billet"]
+    assert client.get("/api/new-words/user123", headers={"If-None-Match": etag}).status_code == 200
@@ -76,6 +76,44 @@ def test_get_user_words(monkeypatch):
     assert result[0].translation == "hello"
     assert result[0].user_id == "00000000-0000-0000-0000-000000000000"
 
+# ---- get_words_bundle ----
+def test_get_words_bundle(monkeypatch):
+    from db import words
+    queries = []
+
+    class MockQuery:
+        def select(self, fields):
+            return self
+
+        def eq(self, key, value):
+            return self
+
+        def order(self, field, desc):
+            return self
+
+        def execute(self):
+            queries.append(1)
+            return MockResponse(data=[{
+                "id": "123",
+                "user_id": "00000000-0000-0000-0000-000000000000",
+                "word": "bonjour",
+                "translation": "hello",
+                "example": None,
+                "created_at": "2024-01-01T00:00:00Z"
+            }])
+
+    class MockFrom:
+        def select(self, fields):
+            return MockQuery()
+
+    monkeypatch.setattr(words.supabase, "from_", lambda table: MockFrom())
+
+    known_words, user_words = words.get_words_bundle("00000000-0000-0000-0000-000000000000")
+
+    assert known_words == ["bonjour"]
+    assert user_words[0].translation == "hello"
+    assert len(queries) == 1
+
 # ---- create_word ----
 def test_create_word(monkeypatch):
     from db import words  # ensure you're importing the right context
@@ -115,6 +153,42 @@ def test_create_word(monkeypatch):
     assert result.translation == "hello"
     assert result.user_id == "00000000-0000-0000-0000-000000000000"
 
+# ---- create_words ----
+def test_create_words_single_insert(monkeypatch):
+    from db import words
+    from models.words_model import WordCreate
+    inserts = []
+
+    class MockInsert:
+        def __init__(self, data):
+            self.data = data
+
+        def execute(self):
+            return MockResponse(data=[
+                {**row, "id": str(i), "created_at": "2024-01-01T00:00:00Z"}
+                for i, row in enumerate(self.data)
+            ])
+
+    class MockFrom:
+        def insert(self, data):
+            inserts.append(data)
+            return MockInsert(data)
+
+    monkeypatch.setattr(words.supabase, "from_", lambda table: MockFrom())
+
+    user_id = "00000000-0000-0000-0000-000000000000"
+    words_data = [
+        WordCreate(word="bonjour", translation="hello", user_id=user_id),
+        WordCreate(word="chat", translation="cat", example="Le chat dort.", user_id=user_id),
+    ]
+    result = words.create_words(user_id, words_data)
+
+    # Both rows go out in one insert call
+    assert len(inserts) == 1
+    assert [row["word"] for row in inserts[0]] == ["bonjour", "chat"]
+    assert [w.word for w in result] == ["bonjour", "chat"]
+    assert result[1].example == "Le chat dort."
+
 # ---- delete_word ----
 def test_delete_word(monkeypatch):
     from db import words  # Ensure correct context
@@ -126,7 +200,7 @@ def test_delete_word(monkeypatch):
             return self
 
         def execute(self):
-            deleted.append(tuple(v for _, v in self.calls))
+            deleted.append(tuple(self.calls))
             return MockResponse(data=[{"id": "123"}])
 
         def __init__(self):
@@ -142,5 +216,33 @@ def test_delete_word(monkeypatch):
     result = words.delete_word("123")
 
     # Assert expected delete arguments and return value
-    assert deleted[0] == ("id", "123")
-    assert result == True
+    assert deleted[0] == (("id", "123"),)
+    assert result
+
+def test_delete_word_scoped_to_user(monkeypatch):
+    from db import words
+    deleted = []
+
+    class MockDeleteQuery:
+        def eq(self, key, val):
+            self.calls.append((key, val))
+            return self
+
+        def execute(self):
+            deleted.append(tuple(self.calls))
+            return MockResponse(data=[])
+
+        def __init__(self):
+            self.calls = []
+
+    class MockFrom:
+        def delete(self):
+            return MockDeleteQuery()
+
+    monkeypatch.setattr(words.supabase, "from_", lambda table: MockFrom())
+
+    # Word not owned by this user -> nothing deleted
+    result = words.delete_word("123", "someone-else")
+
+    assert deleted[0] == (("id", "123"), ("user_id", "someone-else"))
+    assert not result
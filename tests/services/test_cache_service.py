@@ -0,0 +1,78 @@
+from unittest.mock import patch
+from services import cache_service
+from models.words_model import WordSuggestion
+
+TEST_USER_ID = "user123"
+
+@patch("services.cache_service.get_words_bundle")
+def test_known_words_cached_until_invalidated(mock_get_words_bundle):
+    cache_service.invalidate_user_words(TEST_USER_ID)
+    mock_get_words_bundle.return_value = (["bonjour", "chat"], [])
+
+    assert cache_service.get_cached_known_words(TEST_USER_ID) == ["bonjour", "chat"]
+    assert cache_service.get_cached_known_words(TEST_USER_ID) == ["bonjour", "chat"]
+    assert mock_get_words_bundle.call_count == 1
+
+    # A mutation drops the entry so the next read goes back to the DB
+    cache_service.invalidate_user_words(TEST_USER_ID)
+    mock_get_words_bundle.return_value = (["bonjour", "chat", "chien"], [])
+
+    assert cache_service.get_cached_known_words(TEST_USER_ID) == ["bonjour", "chat", "chien"]
+    assert mock_get_words_bundle.call_count == 2
+
+@patch("services.cache_service.get_words_bundle")
+def test_user_words_cache_counts_hits_and_misses(mock_get_words_bundle):
+    cache_service.invalidate_user_words(TEST_USER_ID)
+    mock_get_words_bundle.return_value = ([], [])
+    before = cache_service.get_cache_stats()["user_words"]
+
+    cache_service.get_cached_user_words(TEST_USER_ID)
+    cache_service.get_cached_user_words(TEST_USER_ID)
+
+    after = cache_service.get_cache_stats()["user_words"]
+    assert after["misses"] == before["misses"] + 1
+    assert after["hits"] == before["hits"] + 1
+    mock_get_words_bundle.assert_called_once_with(TEST_USER_ID)
+
+@patch("services.cache_service.get_words_bundle")
+def test_single_query_fills_both_caches(mock_get_words_bundle):
+    cache_service.invalidate_user_words(TEST_USER_ID)
+    mock_get_words_bundle.return_value = (["bonjour"], [])
+
+    cache_service.get_cached_user_words(TEST_USER_ID)
+    assert cache_service.get_cached_known_words(TEST_USER_ID) == ["bonjour"]
+    mock_get_words_bundle.assert_called_once_with(TEST_USER_ID)
+
+def test_suggestion_cache_ignores_word_order():
+    suggestion = WordSuggestion(new_words=["gare"], usages={
+        "gare": {"translation": "station", "fr": "La gare.", "en": "The station."}
+    })
+    cache_service.cache_suggestion(["train", "bonjour"], suggestion)
+
+    assert cache_service.get_cached_suggestion(["bonjour", "train"]) is suggestion
+    assert cache_service.get_cached_suggestion(["bonjour"]) is None
+
+def test_invalidate_clears_session_known_words():
+    from services.user_session_service import SESSION_STORE
+    from models.user_session import UserSession
+
+    SESSION_STORE[TEST_USER_ID] = UserSession(user_id=TEST_USER_ID, known_words=["bonjour"])
+
+    cache_service.invalidate_user_words(TEST_USER_ID)
+
+    assert SESSION_STORE[TEST_USER_ID].known_words == []
+
+@patch("services.cache_service.get_words_bundle")
+def test_stale_read_not_cached_after_invalidation(mock_get_words_bundle):
+    cache_service.invalidate_user_words(TEST_USER_ID)
+
+    def read_then_mutate(user_id):
+        # A write lands while this (old) read is still in flight
+        cache_service.invalidate_user_words(user_id)
+        return ["bonjour"], []
+
+    mock_get_words_bundle.side_effect = read_then_mutate
+
+    assert cache_service.get_cached_known_words(TEST_USER_ID) == ["bonjour"]
+    assert cache_service.peek_cached_known_words(TEST_USER_ID) is None
+    assert cache_service.peek_cached_user_words(TEST_USER_ID) is None
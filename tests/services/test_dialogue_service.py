@@ -0,0 +1,119 @@
+import pytest
+import json
+from unittest.mock import patch, AsyncMock
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.function import FunctionModel
+from agents import dialogue_agent
+from services.cache_service import invalidate_user_words
+from services.user_session_service import SESSION_STORE, get_session
+from services.words_service import suggest_new_words_for_user
+from services.dialogue_service import run_dialogue_turn
+
+TEST_USER_ID = "prewarm-user"
+
+@pytest.mark.asyncio
+@patch("services.dialogue_service.increment_dialogue_sessions")
+@patch("services.llm_service.create_dialogue_agent")
+@patch("services.llm_service.words_agent")
+@patch("services.words_service.fetch_known_words")
+async def test_first_turn_reuses_prewarmed_agent(
+    mock_fetch_known_words, mock_words_agent, mock_create_dialogue_agent, mock_increment
+):
+    SESSION_STORE.pop(TEST_USER_ID, None)
+
+    # fetch_known_words stores the words on the session, like the real one
+    async def fetch_known_words(user_id):
+        get_session(user_id).known_words = ["quai", "valise"]
+        return ["quai", "valise"]
+
+    mock_fetch_known_words.side_effect = fetch_known_words
+    mock_words_agent.run = AsyncMock()
+    mock_words_agent.run.return_value.output = json.dumps({
+        "new_words": ["horaire"],
+        "usages": {
+            "horaire": {"translation": "timetable", "fr": "L'horaire du quai.", "en": "The platform timetable."}
+        }
+    })
+    mock_create_dialogue_agent.side_effect = lambda prompt: Agent(model=TestModel(), output_type=str)
+
+    # /new-words (or the suggestion side of /dialogue) builds the agent up front
+    await suggest_new_words_for_user(TEST_USER_ID)
+    prewarmed_agent = get_session(TEST_USER_ID).dialogue_agent
+    assert prewarmed_agent is not None
+    assert mock_create_dialogue_agent.call_count == 1
+
+    # The first turn uses it as-is instead of building another
+    await run_dialogue_turn(user_id=TEST_USER_ID, student_response="Bonjour")
+
+    assert get_session(TEST_USER_ID).dialogue_agent is prewarmed_agent
+    assert mock_create_dialogue_agent.call_count == 1
+    SESSION_STORE.pop(TEST_USER_ID, None)
+
+
+@pytest.mark.asyncio
+@patch("services.dialogue_service.increment_dialogue_sessions")
+@patch("services.words_service.get_cached_known_words")
+@patch("services.words_service.peek_cached_known_words", return_value=None)
+async def test_mutation_between_turns_reaches_model(
+    mock_peek, mock_get_cached_known_words, mock_increment, monkeypatch
+):
+    user_id = "mutation-user"
+    SESSION_STORE.pop(user_id, None)
+    seen_instructions = []
+
+    def reply(messages, info):
+        seen_instructions.append(messages[-1].instructions)
+        return ModelResponse(parts=[TextPart("Bonjour !")])
+
+    monkeypatch.setattr(dialogue_agent, "DIALOGUE_LLM_MODEL", FunctionModel(reply))
+    mock_get_cached_known_words.return_value = ["guichet"]
+    await run_dialogue_turn(user_id=user_id, student_response="Bonjour")
+
+    # The user adds a word mid-dialogue
+    mock_get_cached_known_words.return_value = ["guichet", "quai"]
+    invalidate_user_words(user_id)
+    await run_dialogue_turn(user_id=user_id, student_response="Ça va")
+
+    assert '"known_words": ["guichet"]' in seen_instructions[0]
+    assert '"known_words": ["guichet","quai"]' in seen_instructions[1]
+    SESSION_STORE.pop(user_id, None)
+
+
+@pytest.mark.asyncio
+@patch("services.dialogue_service.increment_dialogue_sessions")
+@patch("services.llm_service.words_agent")
+@patch("services.words_service.get_cached_known_words", return_value=["quai"])
+@patch("services.words_service.peek_cached_known_words", return_value=None)
+async def test_later_turn_uses_prewarmed_agent(
+    mock_peek, mock_get_cached_known_words, mock_words_agent, mock_increment, monkeypatch
+):
+    user_id = "later-turn-user"
+    SESSION_STORE.pop(user_id, None)
+    seen_instructions = []
+
+    def reply(messages, info):
+        seen_instructions.append(messages[-1].instructions)
+        return ModelResponse(parts=[TextPart("Bonjour !")])
+
+    monkeypatch.setattr(dialogue_agent, "DIALOGUE_LLM_MODEL", FunctionModel(reply))
+    await run_dialogue_turn(user_id=user_id, student_response="Bonjour")
+    assert get_session(user_id).dialogue_history
+
+    # Suggestions arrive after the dialogue has history
+    mock_words_agent.run = AsyncMock()
+    mock_words_agent.run.return_value.output = json.dumps({
+        "new_words": ["contrôleur"],
+        "usages": {
+            "contrôleur": {"translation": "inspector", "fr": "Le contrôleur passe.", "en": "The inspector comes by."}
+        }
+    })
+    await suggest_new_words_for_user(user_id)
+    prewarmed_agent = get_session(user_id).dialogue_agent
+
+    await run_dialogue_turn(user_id=user_id, student_response="Ça va")
+
+    assert get_session(user_id).dialogue_agent is prewarmed_agent
+    assert '"new_words": ["contrôleur"]' in seen_instructions[1]
+    SESSION_STORE.pop(user_id, None)
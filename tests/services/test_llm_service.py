@@ -18,14 +18,17 @@ async def test_suggest_new_words_for_user(mock_words_agent, mock_fetch_known_wor
         "new_words": ["billet", "gare", "retard"],
         "usages": {
             "billet": {
+                "translation": "ticket",
                 "fr": "J'ai acheté un billet pour Paris.",
                 "en": "I bought a ticket to Paris."
             },
             "gare": {
+                "translation": "station",
                 "fr": "Nous sommes arrivés à la gare à temps.",
                 "en": "We arrived at the station on time."
             },
             "retard": {
+                "translation": "delay",
                 "fr": "Le train a eu un retard de 20 minutes.",
                 "en": "The train was 20 minutes late."
             }
@@ -40,3 +43,122 @@ async def test_suggest_new_words_for_user(mock_words_agent, mock_fetch_known_wor
     assert isinstance(result, WordSuggestion)
     assert result.usages["gare"].fr.startswith("Nous sommes")
     assert result.usages["retard"].en.endswith("late.")
+
+@pytest.mark.asyncio
+@patch("services.llm_service.words_agent")
+async def test_suggest_new_words_drops_words_without_usage(mock_words_agent):
+    from services.llm_service import suggest_new_words
+
+    mock_words_agent.run = AsyncMock()
+    mock_words_agent.run.return_value.output = json.dumps({
+        "new_words": ["plage", "soleil"],
+        "usages": {
+            "plage": {
+                "translation": "beach",
+                "fr": "La plage est belle.",
+                "en": "The beach is beautiful."
+            }
+        }
+    })
+
+    result = await suggest_new_words(["mer", "belle"])
+
+    assert result.new_words == ["plage"]
+    assert [word for word, _ in result.items] == ["plage"]
+    assert result.items[0][1].translation == "beach"
+
+@pytest.mark.asyncio
+async def test_run_agent_retries_rate_limited_call(monkeypatch):
+    from pydantic_ai.exceptions import ModelHTTPError
+    from services import llm_service
+
+    # Skip the real backoff sleep
+    monkeypatch.setattr(llm_service._run_agent.retry, "sleep", AsyncMock())
+
+    agent = AsyncMock()
+    agent.run.side_effect = [ModelHTTPError(429, "test-model"), "ok"]
+
+    result = await llm_service._run_agent(agent, user_prompt="bonjour")
+
+    assert result == "ok"
+    assert agent.run.call_count == 2
+
+@pytest.mark.asyncio
+async def test_run_agent_does_not_retry_other_errors(monkeypatch):
+    from pydantic_ai.exceptions import ModelHTTPError
+    from services import llm_service
+
+    monkeypatch.setattr(llm_service._run_agent.retry, "sleep", AsyncMock())
+
+    agent = AsyncMock()
+    agent.run.side_effect = ModelHTTPError(500, "test-model")
+
+    with pytest.raises(ModelHTTPError):
+        await llm_service._run_agent(agent, user_prompt="bonjour")
+    assert agent.run.call_count == 1
+
+@patch("services.llm_service.create_dialogue_agent")
+def test_dialogue_prompt_escapes_word_lists(mock_create_dialogue_agent):
+    from services.llm_service import _build_dialogue_agent
+
+    _build_dialogue_agent.__wrapped__(('dit "oui"', "c\\est"), ("été",))
+
+    prompt = mock_create_dialogue_agent.call_args.args[0]
+    assert '"known_words": ["dit \\"oui\\"","c\\\\est"]' in prompt
+    assert '"new_words": ["été"]' in prompt
+
+@pytest.mark.asyncio
+async def test_dialogue_word_lists_reach_model_on_later_turns(monkeypatch):
+    from pydantic_ai.messages import ModelResponse, TextPart
+    from pydantic_ai.models.function import FunctionModel
+    from agents import dialogue_agent
+    from services.llm_service import get_dialogue_response
+    from services.user_session_service import SESSION_STORE
+
+    seen_instructions = []
+
+    def reply(messages, info):
+        seen_instructions.append(messages[-1].instructions)
+        return ModelResponse(parts=[TextPart("Bonjour !")])
+
+    monkeypatch.setattr(dialogue_agent, "DIALOGUE_LLM_MODEL", FunctionModel(reply))
+    SESSION_STORE.pop("instructions-user", None)
+
+    _, history = await get_dialogue_response(
+        "instructions-user", ["quai"], ["consigne"], "Bonjour", []
+    )
+    # Second turn has history and a different new word
+    await get_dialogue_response(
+        "instructions-user", ["quai"], ["composter"], "Ça va", history
+    )
+
+    assert '"new_words": ["consigne"]' in seen_instructions[0]
+    assert '"new_words": ["composter"]' in seen_instructions[1]
+    assert "consigne" not in seen_instructions[1]
+    SESSION_STORE.pop("instructions-user", None)
+
+@pytest.mark.asyncio
+async def test_stream_dialogue_response_yields_deltas_and_history():
+    from pydantic_ai import Agent
+    from pydantic_ai.models.test import TestModel
+    from services import llm_service
+
+    agent = Agent(model=TestModel(custom_output_text="Bonjour, ça va ?"), output_type=str)
+    completed = []
+
+    with patch("services.llm_service.get_session_dialogue_agent", return_value=agent):
+        deltas = [
+            delta async for delta in llm_service.stream_dialogue_response(
+                user_id="user123",
+                known_words=["bonjour"],
+                new_words=[],
+                student_response="Salut",
+                dialogue_history=[],
+                on_complete=completed.append,
+            )
+        ]
+
+    assert "".join(deltas) == "Bonjour, ça va ?"
+    assert len(completed[0]) == 2
+    # The LLM slot is released once generation is done
+    assert llm_service._LLM_SEM._value == llm_service.LLM_MAX_CONCURRENCY
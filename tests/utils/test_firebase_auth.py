@@ -0,0 +1,59 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+from fastapi import HTTPException
+from utils import firebase_auth
+
+NOW = 1_700_000_000
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    firebase_auth._TOKEN_CACHE.clear()
+    yield
+    firebase_auth._TOKEN_CACHE.clear()
+
+def _clock(monkeypatch, now):
+    monkeypatch.setattr(firebase_auth, "time", SimpleNamespace(time=lambda: now))
+
+@patch("utils.firebase_auth.verify_firebase_token")
+def test_cached_token_reused_until_exp(mock_verify, monkeypatch):
+    mock_verify.return_value = {"uid": "user123", "email": "", "exp": NOW + 60}
+
+    _clock(monkeypatch, NOW)
+    firebase_auth.verify_firebase_token_cached("token")
+    firebase_auth.verify_firebase_token_cached("token")
+    assert mock_verify.call_count == 1
+
+    # Past exp the token must be verified again, never served from cache
+    _clock(monkeypatch, NOW + 61)
+    firebase_auth.verify_firebase_token_cached("token")
+    assert mock_verify.call_count == 2
+
+@pytest.mark.parametrize("user_info", [
+    {"uid": "user123", "email": ""},
+    {"uid": "user123", "email": "", "exp": 0},
+])
+@patch("utils.firebase_auth.verify_firebase_token")
+def test_token_without_exp_not_cached(mock_verify, user_info, monkeypatch):
+    mock_verify.return_value = user_info
+    _clock(monkeypatch, NOW)
+
+    firebase_auth.verify_firebase_token_cached("token")
+    firebase_auth.verify_firebase_token_cached("token")
+
+    assert mock_verify.call_count == 2
+    assert len(firebase_auth._TOKEN_CACHE) == 0
+
+@patch("utils.firebase_auth.verify_firebase_token")
+def test_failed_verification_not_cached(mock_verify, monkeypatch):
+    mock_verify.side_effect = HTTPException(status_code=401, detail="Invalid token")
+    _clock(monkeypatch, NOW)
+
+    with pytest.raises(HTTPException):
+        firebase_auth.verify_firebase_token_cached("token")
+    assert len(firebase_auth._TOKEN_CACHE) == 0
+
+    # Once the token verifies, the earlier failure doesn't stick
+    mock_verify.side_effect = None
+    mock_verify.return_value = {"uid": "user123", "email": "", "exp": NOW + 60}
+    assert firebase_auth.verify_firebase_token_cached("token")["uid"] == "user123"